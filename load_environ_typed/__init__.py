@@ -1,7 +1,7 @@
 from typing import (
-    Any, Callable, Dict, List, Mapping, Optional,
+    Any, Callable, Dict, List, Mapping, NamedTuple, Optional,
     Tuple, Type, TypeVar, Union,
-    get_type_hints,
+    get_args, get_origin, get_type_hints,
 )
 
 try:
@@ -13,25 +13,45 @@ except ImportError:
         for python versions below 3.10
         """
 
-import dataclasses
 import datetime
 import os
+import sys
+import types
+import weakref
 
 T = TypeVar('T')
 
+# Marks a missing value where None is a valid value
+_MISSING = object()
+
 
 class LoadEnvironmentException(BaseException):
     pass
 
 
+_BOOL_MAP = {'true': True, 'false': False}
+
+
 def load_bool(raw: str) -> bool:
-    if 'true' == raw.lower():
-        return True
+    value = _try_load_bool(raw)
 
-    if 'false' == raw.lower():
-        return False
+    if value is None:
+        raise ValueError(f'"{raw}" cannot be parsed as boolean')
+
+    return value
+
+
+def _try_load_bool(raw: str) -> Optional[bool]:
+    """
+    Like load_bool, but returns None instead of raising
 
-    raise ValueError(f'"{raw}" cannot be parsed as boolean')
+    Only "true" and "false" can match, so we don't bother
+    lowercasing values of any other length.
+    """
+    if len(raw) != 4 and len(raw) != 5:
+        return None
+
+    return _BOOL_MAP.get(raw.lower())
 
 
 DEFAULT_LOADERS = {
@@ -77,12 +97,89 @@ def load(
     complicated rules, pass a function via `field_name_to_var_name`.
     """
     if environ is None:
-        environ = dict(os.environ)
+        environ = os.environ
     if defaults is None:
         defaults = {}
     if loaders is None:
         loaders = {}
 
+    schema = _resolve_type_schema(type_)
+
+    # Only the loaders for our fields and their types are relevant
+    # for the plan, so unrelated entries don't cause cache misses
+    field_loader_items = tuple(
+        (key, loader)
+        for key, loader in loaders.items()
+        if key in schema.field_names or key in schema.field_types
+    )
+
+    # Part of the key as well, so entries added to DEFAULT_LOADERS
+    # after the first load are picked up
+    default_loader_items = tuple(
+        (key, DEFAULT_LOADERS[key])
+        for key in schema.field_types
+        if key in DEFAULT_LOADERS
+    ) if use_default_loaders else ()
+
+    compiled_loader = _resolve_compiled_loader(
+        type_,
+        field_loader_items,
+        default_loader_items,
+        field_name_to_var_name,
+    )
+
+    result: T = compiled_loader(type_, environ, defaults)
+    return result
+
+
+class _TypeSchema(NamedTuple):
+    """
+    Everything load needs to know about a type that does not
+    depend on the arguments passed to load
+    """
+    field_names: Tuple[str, ...]
+    typed_defaults: Mapping[str, Any]
+    field_types: Tuple[Type[Any], ...]
+    is_optional_types: Tuple[bool, ...]
+    is_positional: bool
+
+
+# Weak, so classes that are no longer used can be garbage collected
+_TYPE_SCHEMA_CACHE: 'weakref.WeakKeyDictionary[Type[Any], _TypeSchema]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _resolve_type_schema(type_: Type[Any]) -> _TypeSchema:
+    """
+    Returns the schema for the given type
+
+    The result is cached, as the fields of a class don't change
+    after it has been created.
+    """
+    try:
+        schema = _TYPE_SCHEMA_CACHE.get(type_)
+    except TypeError:
+        # Not a class, so it can't be weakly referenced; this raises
+        # the RuntimeError for types we can't load
+        return _build_type_schema(type_)
+
+    if schema is None:
+        schema = _build_type_schema(type_)
+        _TYPE_SCHEMA_CACHE[type_] = schema
+
+    return schema
+
+
+def _build_type_schema(type_: Type[Any]) -> _TypeSchema:
+    """
+    Introspects the given dataclass or NamedTuple
+    """
+    # Imported here as it is slow to import, and not needed
+    # when only using NamedTuples. If type_ is a dataclass,
+    # the module has been imported already anyhow.
+    import dataclasses
+
     if dataclasses.is_dataclass(type_):
         dc_field_list = dataclasses.fields(type_)
         field_name_list = [x.name for x in dc_field_list]
@@ -93,86 +190,242 @@ def load(
         }
     else:
         try:
-            field_name_list = getattr(type_, '_fields')
+            field_name_list = list(getattr(type_, '_fields'))
             typed_defaults = getattr(type_, '_field_defaults')
         except AttributeError:
             raise RuntimeError(
                 f'{type_!r} is not a dataclasses.dataclass'
                 ' and not a typing.NamedTuple')
 
-    kwargs: Dict[str, Any] = {}
-
-    errors: List[str] = []
+    is_positional = _init_is_positional(type_, field_name_list)
 
     # Load the type annotations in case they are forward references
     annotations = get_type_hints(type_)
 
-    for field_name in field_name_list:
-        variable_name = field_name_to_var_name(field_name)
+    optional_list = [
+        check_optional(annotations[field_name])
+        for field_name in field_name_list
+    ]
 
-        field_type = annotations[field_name]
-        field_type, is_optional_type = check_optional(field_type)
+    return _TypeSchema(
+        field_names=tuple(field_name_list),
+        typed_defaults=types.MappingProxyType(dict(typed_defaults)),
+        field_types=tuple(x[0] for x in optional_list),
+        is_optional_types=tuple(x[1] for x in optional_list),
+        is_positional=is_positional,
+    )
 
-        try:
-            field_loader = loaders[field_name]
-        except KeyError:
-            try:
-                if not use_default_loaders:
-                    raise KeyError
 
-                field_loader = DEFAULT_LOADERS[field_type]
-            except KeyError:
-                field_loader = field_type
+def _init_is_positional(type_: Type[Any], field_name_list: List[str]) -> bool:
+    """
+    Checks whether type_ can be called with the fields as positional
+    arguments, in order
+
+    This is not the case for kw_only or init=False fields, or for
+    classes that define their own __init__ or __new__ with other
+    parameters.
+    """
+    # dataclasses imports inspect as well
+    import inspect
+
+    try:
+        parameter_list = list(inspect.signature(type_).parameters.values())
+    except (TypeError, ValueError):
+        return False
+
+    return (
+        [x.name for x in parameter_list] == field_name_list
+        and all(
+            x.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            for x in parameter_list
+        )
+    )
+
+
+class _FieldPlan(NamedTuple):
+    """
+    How to load a single field, as decided by _compile_loader
+    """
+    field_name: str
+    variable_name: str
+    field_type_str: str
+    missing_error: str
+    is_optional_type: bool
+    field_loader: Callable[[str], Any]
+
+
+CompiledLoader = Callable[
+    [Type[Any], Mapping[str, str], Mapping[str, str]], Any]
+FieldLoaderItems = Tuple[
+    Tuple[Union[str, Type[Any]], Callable[[str], Any]], ...]
+DefaultLoaderItems = Tuple[Tuple[Type[Any], Callable[[str], Any]], ...]
+
+_COMPILED_LOADER_CACHE_SIZE = 128
+
+# Weak, so classes that are no longer used can be garbage collected.
+# The compiled loaders take the class as an argument rather than
+# referencing it, otherwise the values would keep their keys alive.
+_COMPILED_LOADER_CACHE: (
+    'weakref.WeakKeyDictionary[Type[Any], Dict[Any, CompiledLoader]]'
+) = weakref.WeakKeyDictionary()
+
+
+def _resolve_compiled_loader(
+    type_: Type[Any],
+    field_loader_items: FieldLoaderItems,
+    default_loader_items: DefaultLoaderItems,
+    field_name_to_var_name: NameConverter,
+) -> CompiledLoader:
+    """
+    Returns the compiled loader for the given type and arguments
+
+    The cache is bounded per class, as the name converter may well
+    be a lambda that is created anew on every call to load.
+    """
+    key = (field_loader_items, default_loader_items, field_name_to_var_name)
+
+    try:
+        hash(key)
+    except TypeError:
+        # Some part of the key is not hashable, skip the cache
+        return _compile_loader(type_, *key)
+
+    class_cache = _COMPILED_LOADER_CACHE.get(type_)
+    if class_cache is None:
+        class_cache = _COMPILED_LOADER_CACHE.setdefault(type_, {})
+
+    compiled_loader = class_cache.get(key)
+    if compiled_loader is None:
+        if len(class_cache) >= _COMPILED_LOADER_CACHE_SIZE:
+            # Dicts keep insertion order, so this is the oldest entry.
+            # Another thread may have evicted it already, so don't
+            # assume it's still there.
+            class_cache.pop(next(iter(class_cache), None), None)
+
+        compiled_loader = _compile_loader(type_, *key)
+        class_cache[key] = compiled_loader
+
+    return compiled_loader
+
+
+def _compile_loader(
+    type_: Type[Any],
+    field_loader_items: FieldLoaderItems,
+    default_loader_items: DefaultLoaderItems,
+    field_name_to_var_name: NameConverter,
+) -> CompiledLoader:
+    """
+    Builds a function that loads the given type from environ
+
+    All decisions that don't depend on the values in environ are
+    made here, once, so the returned function only has to look up
+    and convert the values.
+    """
+    schema = _resolve_type_schema(type_)
+    loaders = dict(field_loader_items)
+    default_loaders = dict(default_loader_items)
+
+    plan_list: List[_FieldPlan] = []
+
+    for field_name, field_type, is_optional_type in zip(
+            schema.field_names,
+            schema.field_types,
+            schema.is_optional_types):
+        # Interned, so lookups in environ can compare by identity.
+        # sys.intern only takes exact str instances.
+        variable_name = field_name_to_var_name(field_name)
+        if type(variable_name) is str:
+            variable_name = sys.intern(variable_name)
+
+        field_loader = loaders.get(field_name)
+        if field_loader is None:
+            field_loader = loaders.get(field_type)
+        if field_loader is None:
+            field_loader = default_loaders.get(field_type, field_type)
+
+        field_type_str = _type_to_str(field_type)
+
+        plan_list.append(_FieldPlan(
+            field_name=field_name,
+            variable_name=variable_name,
+            field_type_str=field_type_str,
+            missing_error=(
+                'No value in environ for required field'
+                f' {variable_name} of type {field_type_str}'
+            ),
+            is_optional_type=is_optional_type,
+            field_loader=getattr(
+                field_loader, 'load_environ_typed', field_loader),
+        ))
+
+    plan = tuple(plan_list)
+    typed_defaults = schema.typed_defaults
+    field_names = schema.field_names
+
+    # Calling the class itself, rather than _make, so an overridden
+    # __new__ is honoured
+    is_positional = schema.is_positional
+
+    def compiled_loader(
+        cls: Type[Any],
+        environ: Mapping[str, str],
+        defaults: Mapping[str, str],
+    ) -> Any:
+        # In the order of the fields, in the plan
+        values: List[Any] = []
+
+        errors: List[str] = []
+
+        for (
+            field_name, variable_name, field_type_str, missing_error,
+            is_optional_type, field_loader,
+        ) in plan:
+            field_value_str = environ.get(variable_name)
+            if field_value_str is None:
+                field_value_str = defaults.get(variable_name)
+            if field_value_str is None:
+                field_value = typed_defaults.get(field_name, _MISSING)
+                if field_value is not _MISSING:
+                    values.append(field_value)
+                elif is_optional_type:
+                    values.append(None)
+                else:
+                    errors.append(missing_error)
+                continue
+
+            if is_optional_type and is_optional_value(field_value_str):
+                values.append(None)
+                continue
 
-        try:
-            field_value_str = environ[variable_name]
-        except KeyError:
             try:
-                field_value_str = defaults[variable_name]
-            except KeyError:
-                try:
-                    field_value = typed_defaults[field_name]
-                    kwargs[field_name] = field_value
-                except KeyError:
-                    if is_optional_type:
-                        kwargs[field_name] = None
-                    else:
-                        errors.append(
-                            'No value in environ for required field'
-                            f' {variable_name} of type '
-                            f'{field_type.__module__}.{field_type.__name__}')
+                field_value = field_loader(field_value_str)
+            except ValueError as ex:
+                errors.append(
+                    f'ValueError for field {variable_name}'
+                    f' of type {field_type_str}: {str(ex)}'
+                )
                 continue
 
-        if is_optional_type and is_optional_value(field_value_str):
-            kwargs[field_name] = None
-            continue
+            values.append(field_value)
 
-        field_loader = getattr(
-            field_loader, 'load_environ_typed', field_loader)
+        if errors:
+            raise LoadEnvironmentException(errors)
 
-        try:
-            field_value = field_loader(field_value_str)
-        except ValueError as ex:
-            # Haven't found a built-in way to stringize a type yet
-            if field_type.__module__ == 'typing':
-                field_type_str = str(field_type)
-            else:
-                field_type_str = (
-                    f'{field_type.__module__}.{field_type.__name__}'
-                )
+        if is_positional:
+            return cls(*values)
 
-            errors.append(
-                f'ValueError for field {variable_name}'
-                f' of type {field_type_str}: {str(ex)}'
-            )
-            continue
+        return cls(**dict(zip(field_names, values)))
 
-        kwargs[field_name] = field_value
+    return compiled_loader
 
-    if errors:
-        raise LoadEnvironmentException(errors)
 
-    return type_(**kwargs)
+def _type_to_str(type_: Type[Any]) -> str:
+    # Haven't found a built-in way to stringize a type yet
+    # PEP 604 unions such as int | str have no __name__
+    if type_.__module__ == 'typing' or not hasattr(type_, '__name__'):
+        return str(type_)
+
+    return f'{type_.__module__}.{type_.__name__}'
 
 
 def check_optional(type_: Type[Any]) -> Tuple[Type[Any], bool]:
@@ -180,19 +433,21 @@ def check_optional(type_: Type[Any]) -> Tuple[Type[Any], bool]:
     Checks whether the given type is an Optional variant
 
     This has some wonkyness regarding which Python version we're on
+
+    load only calls this when building the schema for a type, see
+    _resolve_type_schema.
     """
-    if getattr(type_, '__origin__', None) is Optional:
-        raise NotImplementedError('TODO')
+    origin = get_origin(type_)
 
-    if (getattr(type_, '__origin__', None) is Union
-            or isinstance(type_, UnionType)):
+    if origin is Union or origin is UnionType:
+        all_args = get_args(type_)
         args = tuple(
             x
-            for x in type_.__args__
+            for x in all_args
             if x is not None and x != type(None)
         )
 
-        if len(args) == len(type_.__args__):
+        if len(args) == len(all_args):
             return type_, False
 
         if len(args) == 1:
@@ -205,4 +460,6 @@ def check_optional(type_: Type[Any]) -> Tuple[Type[Any], bool]:
 
 
 def is_optional_value(raw: str) -> bool:
-    return raw == '' or raw.lower() == 'none'
+    # Only lowercase when the length matches, which saves a copy
+    # for nearly all values
+    return not raw or (len(raw) == 4 and raw.lower() == 'none')
@@ -1,4 +1,8 @@
-from typing import Dict
+from typing import Dict, List
+
+import re
+import string
+import sys
 
 # Taken from https://github.com/jkakar/logfmt-python
 # and then https://github.com/wlonk/logfmt-python
@@ -13,11 +17,68 @@ EQUAL = 2
 IVALUE = 3
 QVALUE = 4
 
+_KEY_CHARS = frozenset(string.digits + string.ascii_letters)
+
+# A single key=value pair, including the spaces before it
+# An empty unquoted value is only allowed at the end of the line
+_PAIR = re.compile(
+    r' *([0-9A-Za-z]+)='
+    r'(?:"((?:[^"\\]|\\["\\])*)"'
+    r'|([^\x00- "][^\x00- ]*)(?= |\Z)'
+    r'|\Z)'
+)
+_UNESCAPE = re.compile(r'\\(["\\])')
+
 
 def parse_line(line: str) -> Dict[str, str]:
+    """
+    Parses a logfmt line into a dictionary
+
+    Well-formed lines are parsed using a regular expression. Anything
+    else is left to the state machine, which also produces the error
+    message pointing at the offending character.
+    """
+    output: Dict[str, str] = {}
+    end = 0
+
+    while end < len(line):
+        # Anchored, as searching onwards from a failed match would
+        # make malformed lines quadratic
+        match = _PAIR.match(line, end)
+        if match is None:
+            break
+
+        key, qvalue, ivalue = match.groups()
+
+        # Parsed keys are typically looked up by the same small
+        # set of names, interning lets those compare by identity
+        key = sys.intern(key)
+
+        if qvalue is not None:
+            if '\\' in qvalue:
+                qvalue = _UNESCAPE.sub(r'\1', qvalue)
+            output[key] = qvalue
+        elif ivalue is not None:
+            output[key] = ivalue
+        else:
+            output[key] = ''
+
+        end = match.end()
+
+    if line[end:].strip(' '):
+        return _parse_line_state_machine(line)
+
+    return output
+
+
+def _parse_line_state_machine(line: str) -> Dict[str, str]:
     output: Dict[str, str] = {}
     key: str = ''
-    value: str = ''
+    # Keys and unquoted values are sliced from line once complete,
+    # quoted values are collected in parts, to avoid repeated +=
+    key_start = 0
+    value_start = 0
+    value_parts: List[str] = []
     escaped = False
     state: int = GARBAGE
 
@@ -25,8 +86,8 @@ def parse_line(line: str) -> Dict[str, str]:
         i += 1
 
         if state == GARBAGE:
-            if '0' <= c <= '9' or 'A' <= c <= 'Z' or 'a' <= c <= 'z':
-                key = c
+            if c in _KEY_CHARS:
+                key_start = i - 1
                 state = KEY
                 continue
 
@@ -36,11 +97,11 @@ def parse_line(line: str) -> Dict[str, str]:
             raise ValueError(f'Unexpected {c} at {i}')
 
         if state == KEY:
-            if '0' <= c <= '9' or 'A' <= c <= 'Z' or 'a' <= c <= 'z':
-                key += c
+            if c in _KEY_CHARS:
                 continue
 
             if c == "=":
+                key = sys.intern(line[key_start:i - 1])
                 state = EQUAL
                 continue
 
@@ -48,13 +109,13 @@ def parse_line(line: str) -> Dict[str, str]:
 
         if state == EQUAL:
             if c == '"':
-                value = ''
+                value_parts = []
                 escaped = False
                 state = QVALUE
                 continue
 
             if c > " ":
-                value = c
+                value_start = i - 1
                 state = IVALUE
                 continue
 
@@ -62,12 +123,11 @@ def parse_line(line: str) -> Dict[str, str]:
 
         if state == IVALUE:
             if c == ' ':
-                output[key] = value
+                output[key] = line[value_start:i - 1]
                 state = GARBAGE
                 continue
 
             if c > " ":
-                value += c
                 continue
 
             raise ValueError(f'Unexpected {c} at {i}')
@@ -76,7 +136,7 @@ def parse_line(line: str) -> Dict[str, str]:
             if c == "\\":
                 if escaped:
                     escaped = False
-                    value += c
+                    value_parts.append(c)
                 else:
                     escaped = True
                 continue
@@ -84,24 +144,24 @@ def parse_line(line: str) -> Dict[str, str]:
             if c == '"':
                 if escaped:
                     escaped = False
-                    value += c
+                    value_parts.append(c)
                 else:
-                    output[key] = value
+                    output[key] = ''.join(value_parts)
                     state = GARBAGE
                 continue
 
             # Within a quoted value, any character goes
-            value += c
+            value_parts.append(c)
             continue
 
     if state == KEY:
-        raise ValueError(f'Missing value for {key}')
+        raise ValueError(f'Missing value for {line[key_start:]}')
 
     if state == EQUAL:
         output[key] = ''
 
     if state == IVALUE:
-        output[key] = value
+        output[key] = line[value_start:]
 
     if state == QVALUE:
         raise ValueError(f'Missing end quote for {key}')
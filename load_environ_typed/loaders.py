@@ -1,22 +1,58 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 
 import csv
+import functools
+import itertools
+import os
+import re
+import stat
 from pathlib import Path
 
-from load_environ_typed import load_bool
+from load_environ_typed import _try_load_bool
 from load_environ_typed import _logfmt
 
+_LIST_DIALECT = 'load_environ_typed.list'
+
+# Registering the dialect once saves building it on every call
+csv.register_dialect(
+    _LIST_DIALECT,
+    delimiter=',',
+    quotechar='"',
+    quoting=csv.QUOTE_MINIMAL,
+    doublequote=True,
+    escapechar=None,  # Not needed with doublequote and QUOTE_MINIMAL
+    skipinitialspace=True,
+    strict=True,
+)
+
+# Path objects are immutable, so they can be shared
+_to_path = functools.lru_cache(maxsize=128)(Path)
+
+# A BEGIN or END line; these are paired up in _iter_pem, as a
+# single regex for both would rescan the rest of the file for every
+# BEGIN line without an END line
+_PEM_MARKER_RE = re.compile(r'^-----(BEGIN|END) .*-----$', re.MULTILINE)
+
+# Line boundaries for str.splitlines, other than \n, that can
+# occur in ASCII text
+_OTHER_LINE_BREAKS_RE = re.compile('[\r\x0b\x0c\x1c\x1d\x1e]')
+
 
 def load_bool_or_int(raw: str) -> Union[bool, int]:
     """
     Return a boolean when raw is equal to TRUE or FALSE
     (case insenstive). Else, returns it an int.
     """
-    try:
-        return load_bool(raw)
-    except ValueError:
+    # Plain integers can't be booleans
+    if raw.isdigit() or (raw[:1] == '-' and raw[1:].isdigit()):
+        return int(raw)
+
+    value = _try_load_bool(raw)
+    if value is None:
         return int(raw)
 
+    return value
+
 
 def load_bool_or_str(raw: str) -> Union[bool, str]:
     """
@@ -25,11 +61,12 @@ def load_bool_or_str(raw: str) -> Union[bool, str]:
 
     Empty string is also returned as string.
     """
-    try:
-        return load_bool(raw)
-    except ValueError:
+    value = _try_load_bool(raw)
+    if value is None:
         return raw
 
+    return value
+
 
 def load_bool_or_path(raw: str) -> Union[bool, Path]:
     """
@@ -38,10 +75,11 @@ def load_bool_or_path(raw: str) -> Union[bool, Path]:
 
     Empty string is also returned as path.
     """
-    try:
-        return load_bool(raw)
-    except ValueError:
-        return Path(raw)
+    value = _try_load_bool(raw)
+    if value is None:
+        return _to_path(raw)
+
+    return value
 
 
 def load_list_int(raw: str) -> List[int]:
@@ -52,6 +90,14 @@ def load_list_int(raw: str) -> List[int]:
     separated list of integers. See load_list_str for
     more details.
     """
+    if not raw:
+        return []
+
+    # Without quotes or line breaks, the CSV reader would return
+    # the same as a plain split; int ignores surrounding whitespace
+    if '"' not in raw and '\n' not in raw and '\r' not in raw:
+        return list(map(int, raw.split(',')))
+
     lst = load_list_str(raw)
 
     return [int(x.strip()) for x in lst]
@@ -67,16 +113,15 @@ def load_list_str(raw: str) -> List[str]:
     - double quotes in your value have to be doubled again
     - we skip spaces after the comma
     """
-    rdr = csv.reader(
-        [raw],
-        delimiter=',',
-        quotechar='"',
-        quoting=csv.QUOTE_MINIMAL,
-        doublequote=True,
-        escapechar=None,  # Not needed with doublequote and QUOTE_MINIMAL
-        skipinitialspace=True,
-        strict=True,
-    )
+    if not raw:
+        return []
+
+    # Without quotes or line breaks, the CSV reader would only
+    # split on the commas and skip the spaces after them
+    if '"' not in raw and '\n' not in raw and '\r' not in raw:
+        return [x.lstrip(' ') for x in raw.split(',')]
+
+    rdr = csv.reader([raw], dialect=_LIST_DIALECT)
 
     return next(rdr)
 
@@ -90,10 +135,73 @@ def load_dict_str_str(raw: str) -> Dict[str, str]:
     return _logfmt.parse_line(raw)
 
 
+class _FileVersion(NamedTuple):
+    """
+    Identifies the contents of a file, to cache them under
+
+    The device, inode, modification time and size are part of it,
+    so we read the file again when it has been changed or replaced,
+    for example by swapping a symlink. The change time is part of it
+    as well, so we notice when permissions have been taken away.
+    """
+    path: str
+    st_dev: int
+    st_ino: int
+    st_mtime_ns: int
+    st_ctime_ns: int
+    st_size: int
+
+
+def _file_version(raw: str) -> Optional[_FileVersion]:
+    """
+    Returns None if the contents of the file should not be cached
+
+    This is the case for anything that is not a regular file, such
+    as pipes and devices, and for empty files, as files in /proc and
+    the like report a size of zero and a fixed modification time.
+    """
+    st = os.stat(raw)
+
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return None
+
+    return _FileVersion(
+        os.path.abspath(raw),
+        st.st_dev,
+        st.st_ino,
+        st.st_mtime_ns,
+        st.st_ctime_ns,
+        st.st_size,
+    )
+
+
+def _read_bytes(path: str) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _read_text(path: str, encoding: str) -> str:
+    # newline='' makes sure line endings are kept as they are
+    with open(path, 'r', encoding=encoding, newline='') as fil:
+        return fil.read()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_bytes_cached(version: _FileVersion) -> bytes:
+    return _read_bytes(version.path)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_cached(version: _FileVersion, encoding: str) -> str:
+    return _read_text(version.path, encoding)
+
+
 def load_binary_file_from_path(raw: str) -> bytes:
     try:
-        with open(raw, 'rb') as fil:
-            return fil.read()
+        version = _file_version(raw)
+        if version is None:
+            return _read_bytes(raw)
+
+        return _read_bytes_cached(version)
     except FileNotFoundError:
         raise ValueError(f'File not found: {raw}')
     except IsADirectoryError:
@@ -102,22 +210,50 @@ def load_binary_file_from_path(raw: str) -> bytes:
         raise ValueError(f'No permissions to read: {raw}')
 
 
-def load_ascii_file_from_path(raw: str) -> str:
-    bts = load_binary_file_from_path(raw)
-
+def _load_text_file_from_path(raw: str, encoding: str) -> str:
+    """
+    Reads and decodes the file, translating errors to ValueError
+    """
     try:
-        return bts.decode('ASCII')
-    except ValueError:
-        raise ValueError(f'Could not decode as ASCII: {raw}')
+        version = _file_version(raw)
+        if version is None:
+            return _read_text(raw, encoding)
+
+        return _read_text_cached(version, encoding)
+    except FileNotFoundError:
+        raise ValueError(f'File not found: {raw}')
+    except IsADirectoryError:
+        raise ValueError(f'Unexpected directory: {raw}')
+    except PermissionError:
+        raise ValueError(f'No permissions to read: {raw}')
+    except UnicodeDecodeError:
+        raise ValueError(f'Could not decode as {encoding}: {raw}')
+
+
+def load_ascii_file_from_path(raw: str) -> str:
+    return _load_text_file_from_path(raw, 'ASCII')
 
 
 def load_utf8_file_from_path(raw: str) -> str:
-    bts = load_binary_file_from_path(raw)
+    return _load_text_file_from_path(raw, 'UTF-8')
 
-    try:
-        return bts.decode('UTF-8')
-    except ValueError:
-        raise ValueError(f'Could not decode as UTF-8: {raw}')
+
+def _iter_pem(txt: str) -> Iterator[str]:
+    """
+    Yields each BEGIN line up to and including the first END line
+    after it, in a single pass over the text
+
+    Parsers MAY disregard the label, so we do.
+    """
+    start: Optional[int] = None
+
+    for match in _PEM_MARKER_RE.finditer(txt):
+        if start is None:
+            if match.group(1) == 'BEGIN':
+                start = match.start()
+        elif match.group(1) == 'END':
+            yield txt[start:match.end()] + '\n'
+            start = None
 
 
 def load_pem_file_from_path(
@@ -135,20 +271,15 @@ def load_pem_file_from_path(
     """
     txt = load_ascii_file_from_path(raw)
 
-    result: List[str] = []
+    if _OTHER_LINE_BREAKS_RE.search(txt):
+        txt = '\n'.join(txt.splitlines())
 
-    data: List[str] = []
-    for line in txt.splitlines():
-        if data:
-            data.append(line)
+    data_iter: Iterable[str] = _iter_pem(txt)
+    if max_data_count is not None and max_data_count >= 0:
+        # One more is enough to know there are too many
+        data_iter = itertools.islice(data_iter, max_data_count + 1)
 
-            if line.startswith('-----END ') and line.endswith('-----'):
-                # Parsers MAY disregard the label
-                result.append('\n'.join(data) + '\n')
-                data = []
-        else:
-            if line.startswith('-----BEGIN ') and line.endswith('-----'):
-                data.append(line)
+    result = list(data_iter)
 
     if not result:
         raise ValueError(f'No valid PEM encoded data found: {raw}')
@@ -1,8 +1,11 @@
-from typing import NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Union
 
 import datetime
+import gc
+import os
 import sys
 import unittest
+import weakref
 from dataclasses import dataclass, FrozenInstanceError
 from pathlib import Path
 
@@ -82,11 +85,42 @@ The acual test cases, from low level to high level
 """
 
 
+class TestCheckOptional(unittest.TestCase):
+    def test_not_optional(self) -> None:
+        self.assertEqual((int, False), sut.check_optional(int))
+        self.assertEqual(
+            (Union[int, str], False),
+            sut.check_optional(Union[int, str]),  # type: ignore [arg-type]
+        )
+        self.assertEqual(
+            (Union[int, str, None], False),
+            sut.check_optional(
+                Union[int, str, None]),  # type: ignore [arg-type]
+        )
+
+    def test_optional(self) -> None:
+        self.assertEqual(
+            (int, True),
+            sut.check_optional(Optional[int]),  # type: ignore [arg-type]
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 10), 'Python 3.10+ only')
+    def test_pep_604(self) -> None:
+        self.assertEqual(
+            (int, True),
+            sut.check_optional(eval('int | None')),
+        )
+
+
 class TestLoad(unittest.TestCase):
     def test_must_be_named_tupled_or_dataclass(self) -> None:
         with self.assertRaises(RuntimeError):
             sut.load(PasswordFromFile)
 
+    def test_must_be_a_class(self) -> None:
+        with self.assertRaises(RuntimeError):
+            sut.load(5)  # type: ignore [arg-type]
+
     def test_error_missing_value(self) -> None:
         with self.assertRaises(sut.LoadEnvironmentException) as cm:
             sut.load(
@@ -100,6 +134,19 @@ class TestLoad(unittest.TestCase):
             'of type builtins.str',
             str(cm.exception))
 
+    def test_error_missing_value_typing(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: List[int]
+
+        with self.assertRaises(sut.LoadEnvironmentException) as cm:
+            sut.load(EnvironType, environ={})
+
+        self.assertIn(
+            'No value in environ for required field VAR '
+            'of type typing.List[int]',
+            str(cm.exception))
+
     def test_field_name_cleanup(self) -> None:
         @dataclass
         class EnvironType:
@@ -268,6 +315,21 @@ class TestLoad(unittest.TestCase):
         environ = sut.load(EnvironType, environ={'VAR': 'none'})
         self.assertEqual(environ.VAR, None)
 
+    def test_empty_value_does_not_use_defaults(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: str
+            OPT: Optional[str] = 'default'
+
+        environ = sut.load(
+            EnvironType,
+            environ={'VAR': '', 'OPT': ''},
+            defaults={'VAR': 'from defaults', 'OPT': 'from defaults'},
+        )
+
+        self.assertEqual('', environ.VAR)
+        self.assertIsNone(environ.OPT)
+
     def test_custom_loader_key(self) -> None:
         # Example from README.md
 
@@ -298,6 +360,56 @@ class TestLoad(unittest.TestCase):
 
         self.assertEqual(datetime.date(2021, 1, 1), environ.ISO_DATE)
 
+    def test_custom_loader_type_overrides_default(self) -> None:
+        @dataclass
+        class MyEnviron:
+            VAR: int
+            FLAG: bool
+
+        environ = sut.load(MyEnviron, environ={
+            'VAR': 'ff',
+            'FLAG': '1',
+        }, loaders={
+            int: lambda x: int(x, 16),
+            bool: lambda x: x == '1',
+        })
+
+        self.assertEqual(255, environ.VAR)
+        self.assertIs(True, environ.FLAG)
+
+    def test_custom_loader_key_before_type(self) -> None:
+        @dataclass
+        class MyEnviron:
+            VAR: int
+
+        environ = sut.load(MyEnviron, environ={
+            'VAR': '10',
+        }, loaders={
+            'VAR': lambda x: int(x, 2),
+            int: lambda x: int(x, 16),
+        })
+
+        self.assertEqual(2, environ.VAR)
+
+    def test_default_loader_added_later(self) -> None:
+        @dataclass
+        class MyEnviron:
+            VAR: int
+
+        environ = sut.load(MyEnviron, environ={'VAR': '10'})
+        self.assertEqual(10, environ.VAR)
+
+        sut.DEFAULT_LOADERS[int] = lambda x: int(x, 16)
+        try:
+            environ = sut.load(MyEnviron, environ={'VAR': '10'})
+            self.assertEqual(16, environ.VAR)
+
+            environ = sut.load(
+                MyEnviron, environ={'VAR': '10'}, use_default_loaders=False)
+            self.assertEqual(10, environ.VAR)
+        finally:
+            del sut.DEFAULT_LOADERS[int]
+
     def test_named_tuple(self) -> None:
         environ = sut.load(
             EnvironNt,
@@ -325,6 +437,64 @@ class TestLoad(unittest.TestCase):
         self.assertEqual(environ.AAA_SORT_TEST, 'zzz')
         self.assertEqual(environ.NT_FIELD, 4)
 
+    def test_named_tuple_subclass_new(self) -> None:
+        class Base(NamedTuple):
+            A: int
+
+        class Sub(Base):
+            def __new__(cls, A: int) -> 'Sub':
+                return super().__new__(cls, A * 2)
+
+        environ = sut.load(Sub, environ={'A': '2'})
+        self.assertEqual(Sub(A=2), environ)
+        self.assertEqual(4, environ.A)
+
+    def test_named_tuple_subclass_new_reordered(self) -> None:
+        class Base(NamedTuple):
+            A: int
+            B: str
+
+        class Sub(Base):
+            def __new__(cls, B: str, A: int) -> 'Sub':
+                return super().__new__(cls, A, B)
+
+        self.assertFalse(sut._resolve_type_schema(Sub).is_positional)
+
+        environ = sut.load(Sub, environ={'A': '1', 'B': 'b'})
+        self.assertEqual(1, environ.A)
+        self.assertEqual('b', environ.B)
+
+    def test_named_tuple_subclass_new_kw_only(self) -> None:
+        class Base(NamedTuple):
+            A: int
+            B: str
+
+        class Sub(Base):
+            def __new__(cls, *, A: int, B: str) -> 'Sub':
+                return super().__new__(cls, A, B)
+
+        self.assertFalse(sut._resolve_type_schema(Sub).is_positional)
+
+        environ = sut.load(Sub, environ={'A': '1', 'B': 'b'})
+        self.assertEqual(1, environ.A)
+        self.assertEqual('b', environ.B)
+
+    def test_fields_kw_only_init(self) -> None:
+        class EnvironType:
+            _fields = ('A', 'B')
+            _field_defaults = {'B': 'b'}
+
+            A: int
+            B: str
+
+            def __init__(self, *, A: int, B: str) -> None:
+                self.A = A
+                self.B = B
+
+        environ = sut.load(EnvironType, environ={'A': '1'})
+        self.assertEqual(1, environ.A)
+        self.assertEqual('b', environ.B)
+
     def test_data_class(self) -> None:
         environ = sut.load(
             EnvironDc,
@@ -366,6 +536,33 @@ class TestLoad(unittest.TestCase):
             # So we have to ignore it since we want to make sure it works
             environ.DB_NAME = 'tpk'  # type: ignore
 
+    def test_data_class_positional(self) -> None:
+        @dataclass
+        class EnvironType:
+            A: int
+            B: str
+
+        self.assertTrue(sut._resolve_type_schema(EnvironType).is_positional)
+
+        environ = sut.load(EnvironType, environ={'A': '1', 'B': 'b'})
+        self.assertEqual(EnvironType(1, 'b'), environ)
+
+    def test_data_class_custom_init(self) -> None:
+        @dataclass
+        class EnvironType:
+            A: int
+            B: str
+
+            def __init__(self, B: str, A: int) -> None:
+                self.A = A
+                self.B = B
+
+        self.assertFalse(sut._resolve_type_schema(EnvironType).is_positional)
+
+        environ = sut.load(EnvironType, environ={'A': '1', 'B': 'b'})
+        self.assertEqual(1, environ.A)
+        self.assertEqual('b', environ.B)
+
     def test_forward_reference_annotation(self) -> None:
         @dataclass
         class FrozenEnviron:
@@ -375,6 +572,136 @@ class TestLoad(unittest.TestCase):
 
         self.assertEqual(environ.DB_NAME, 'database')
 
+    def test_os_environ(self) -> None:
+        @dataclass
+        class EnvironType:
+            LOAD_ENVIRON_TYPED_TEST_VAR: int
+
+        os.environ['LOAD_ENVIRON_TYPED_TEST_VAR'] = '12'
+        try:
+            environ = sut.load(EnvironType)
+        finally:
+            del os.environ['LOAD_ENVIRON_TYPED_TEST_VAR']
+
+        self.assertEqual(environ.LOAD_ENVIRON_TYPED_TEST_VAR, 12)
+
+    def test_type_schema_cached(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: 'int'
+
+        environ = sut.load(EnvironType, environ={'VAR': '1'})
+        self.assertEqual(environ.VAR, 1)
+
+        schema = sut._TYPE_SCHEMA_CACHE[EnvironType]
+        environ = sut.load(EnvironType, environ={'VAR': '2'})
+        self.assertEqual(environ.VAR, 2)
+        self.assertIs(schema, sut._resolve_type_schema(EnvironType))
+
+    def test_type_schema_cache_weak(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: int
+
+        sut.load(EnvironType, environ={'VAR': '1'})
+        ref = weakref.ref(EnvironType)
+
+        del EnvironType
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_compiled_loader_cached(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: int
+
+        sut.load(EnvironType, environ={'VAR': '1'})
+
+        class_cache = sut._COMPILED_LOADER_CACHE[EnvironType]
+        compiled_loader_list = list(class_cache.values())
+        environ = sut.load(EnvironType, environ={'VAR': '2'})
+        self.assertEqual(environ.VAR, 2)
+        self.assertEqual(compiled_loader_list, list(class_cache.values()))
+        self.assertEqual(1, len(compiled_loader_list))
+
+    def test_compiled_loader_cache_bounded(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: int
+
+        for _ in range(sut._COMPILED_LOADER_CACHE_SIZE + 10):
+            sut.load(EnvironType, environ={'VAR': '1'},
+                     field_name_to_var_name=lambda x: x.upper())
+
+        self.assertEqual(
+            sut._COMPILED_LOADER_CACHE_SIZE,
+            len(sut._COMPILED_LOADER_CACHE[EnvironType]))
+
+    def test_field_name_to_var_name_cached(self) -> None:
+        @dataclass
+        class EnvironType:
+            var: int
+
+        called: List[str] = []
+
+        def field_name_to_var_name(field_name: str) -> str:
+            called.append(field_name)
+            return field_name.upper()
+
+        for inp in ['1', '2', '3']:
+            environ = sut.load(EnvironType, environ={'VAR': inp},
+                               field_name_to_var_name=field_name_to_var_name)
+            self.assertEqual(environ.var, int(inp))
+
+        self.assertEqual(['var'], called)
+
+    def test_field_name_to_var_name_str_subclass(self) -> None:
+        class VarName(str):
+            pass
+
+        @dataclass
+        class EnvironType:
+            var: int
+
+        environ = sut.load(EnvironType, environ={'VAR': '1'},
+                           field_name_to_var_name=lambda x: VarName(x.upper()))
+        self.assertEqual(environ.var, 1)
+
+    def test_field_name_to_var_name_type_error(self) -> None:
+        @dataclass
+        class EnvironType:
+            var: int
+
+        called: List[str] = []
+
+        def field_name_to_var_name(field_name: str) -> str:
+            called.append(field_name)
+            raise TypeError('Broken')
+
+        with self.assertRaises(TypeError):
+            sut.load(EnvironType, environ={'VAR': '1'},
+                     field_name_to_var_name=field_name_to_var_name)
+
+        self.assertEqual(['var'], called)
+
+    def test_compiled_loader_unhashable_loader(self) -> None:
+        class UnhashableLoader:
+            def __eq__(self, other: object) -> bool:
+                return self is other
+
+            def __call__(self, raw: str) -> int:
+                return int(raw) * 2
+
+        @dataclass
+        class EnvironType:
+            VAR: int
+
+        environ = sut.load(EnvironType, environ={'VAR': '2'}, loaders={
+            'VAR': UnhashableLoader(),
+        })
+        self.assertEqual(environ.VAR, 4)
+
     @unittest.skipIf(sys.version_info < (3, 10), 'Python 3.10+ only')
     def test_pep_604(self) -> None:
         @dataclass
@@ -385,6 +712,24 @@ class TestLoad(unittest.TestCase):
 
         self.assertEqual(environ.DB_NAME, 'database')
 
+    @unittest.skipIf(sys.version_info < (3, 10), 'Python 3.10+ only')
+    def test_pep_604_union_with_loader(self) -> None:
+        @dataclass
+        class EnvironType:
+            VAR: 'int | str'
+
+        environ = sut.load(EnvironType, environ={'VAR': '1'}, loaders={
+            'VAR': int,
+        })
+        self.assertEqual(environ.VAR, 1)
+
+        with self.assertRaises(sut.LoadEnvironmentException) as cm:
+            sut.load(EnvironType, environ={})
+
+        self.assertIn(
+            'No value in environ for required field VAR of type int | str',
+            str(cm.exception))
+
     @unittest.skipIf(sys.version_info < (3, 10), 'Python 3.10+ only')
     def test_kw_only(self) -> None:
         @dataclass(kw_only=True)  # type: ignore [call-overload,unused-ignore]
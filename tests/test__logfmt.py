@@ -43,6 +43,27 @@ class TestParseLine(unittest.TestCase):
             )
         )
 
+    def test_adjacent(self) -> None:
+        self.assertEqual(
+            {'a': 'x', 'b': '1'},
+            sut.parse_line('a="x"b=1'),
+        )
+        self.assertEqual({'a': '1"2'}, sut.parse_line('a=1"2'))
+        self.assertEqual({'a': 'b=c'}, sut.parse_line('a=b=c'))
+        self.assertEqual(
+            {'a': '\\"'},
+            sut.parse_line('a="\\\\\\""'),
+        )
+
+    def test_state_machine(self) -> None:
+        # Well-formed lines don't reach the state machine via parse_line
+        self.assertEqual(
+            {'a': '1', 'b': '', 'msg': 'Say "hi" \\o/', 'c': ''},
+            sut._parse_line_state_machine(
+                'a=1 b="" msg="Say \\"hi\\" \\\\o/" c=',
+            )
+        )
+
     def test_errors(self) -> None:
         with self.assertRaisesRegex(ValueError, 'Unexpected @ at 1'):
             sut.parse_line('@')
@@ -76,3 +97,17 @@ class TestParseLine(unittest.TestCase):
 
         with self.assertRaisesRegex(ValueError, 'Missing end quote for b'):
             sut.parse_line('a=1 b="123')
+
+        with self.assertRaisesRegex(ValueError, 'Unexpected   at 3'):
+            sut.parse_line('a= b=1')
+
+    def test_errors_long_line(self) -> None:
+        # These used to take time quadratic in the length of the line
+        with self.assertRaisesRegex(ValueError, 'Missing value for a'):
+            sut.parse_line('a' * 100000)
+
+        with self.assertRaisesRegex(ValueError, 'Missing end quote for a'):
+            sut.parse_line('a="' + 'x' * 100000)
+
+        with self.assertRaisesRegex(ValueError, 'Missing end quote for b'):
+            sut.parse_line('a=1 ' * 10000 + 'b="' + 'x' * 100000)
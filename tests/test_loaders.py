@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -36,9 +38,14 @@ class TestLoaders(unittest.TestCase):
         self.assertEqual([1, 2], sut.load_list_int('1, 2'))
         self.assertEqual([-100, 0, 100], sut.load_list_int('-100,0,100'))
 
+        self.assertEqual([1, 2], sut.load_list_int('"1", 2'))
+
         with self.assertRaises(ValueError):
             sut.load_list_int('1,2,a')
 
+        with self.assertRaises(ValueError):
+            sut.load_list_int('1,,2')
+
     def test_load_list_str(self) -> None:
         self.assertEqual([], sut.load_list_str(''))
         self.assertEqual(['1'], sut.load_list_str('1'))
@@ -103,12 +110,99 @@ class TestLoaders(unittest.TestCase):
             'Could not decode as UTF-8: ./tests/numbers.bin',
             str(cm.exception))
 
+    def test_load_utf8_from_path_null_byte(self) -> None:
+        with self.assertRaises(ValueError) as cm:
+            sut.load_utf8_file_from_path('./tests/utf8.txt\0')
+
+        self.assertNotIn('Could not decode', str(cm.exception))
+
     def test_load_utf8_file_from_path_ok(self) -> None:
         self.assertIn(
             '\u864e',
             sut.load_utf8_file_from_path('./tests/utf8.txt'),
         )
 
+    def test_load_utf8_file_from_path_line_endings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'utf8.txt'
+            path.write_bytes(b'a\r\nb\rc\n')
+
+            self.assertEqual(
+                'a\r\nb\rc\n',
+                sut.load_utf8_file_from_path(str(path)),
+            )
+
+    def test_load_utf8_file_from_path_changed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'utf8.txt'
+
+            path.write_text('before', encoding='utf-8')
+            self.assertEqual(
+                'before',
+                sut.load_utf8_file_from_path(str(path)),
+            )
+            self.assertEqual(
+                b'before',
+                sut.load_binary_file_from_path(str(path)),
+            )
+
+            path.write_text('and after', encoding='utf-8')
+            self.assertEqual(
+                'and after',
+                sut.load_utf8_file_from_path(str(path)),
+            )
+            self.assertEqual(
+                b'and after',
+                sut.load_binary_file_from_path(str(path)),
+            )
+
+    def test_load_utf8_file_from_path_replaced(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'utf8.txt'
+            old_path = Path(tmpdir) / 'old.txt'
+            new_path = Path(tmpdir) / 'new.txt'
+
+            old_path.write_text('old', encoding='utf-8')
+            new_path.write_text('new', encoding='utf-8')
+            stat = old_path.stat()
+            os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            path.symlink_to(old_path)
+            self.assertEqual('old', sut.load_utf8_file_from_path(str(path)))
+
+            path.unlink()
+            path.symlink_to(new_path)
+            self.assertEqual('new', sut.load_utf8_file_from_path(str(path)))
+
+    def test_load_utf8_file_from_path_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'utf8.txt'
+            path.write_text('', encoding='utf-8')
+
+            self.assertIsNone(sut._file_version(str(path)))
+            self.assertEqual('', sut.load_utf8_file_from_path(str(path)))
+
+            path.write_text('cached', encoding='utf-8')
+
+            self.assertIsNotNone(sut._file_version(str(path)))
+            self.assertEqual(
+                'cached', sut.load_utf8_file_from_path(str(path)))
+
+            self.assertIsNone(sut._file_version(tmpdir))
+
+    @unittest.skipUnless(os.path.exists('/proc/uptime'), 'Needs procfs')
+    def test_load_utf8_file_from_path_proc(self) -> None:
+        self.assertIsNone(sut._file_version('/proc/uptime'))
+        self.assertTrue(sut.load_utf8_file_from_path('/proc/uptime'))
+
+    def test_load_utf8_file_from_path_directory(self) -> None:
+        with self.assertRaises(ValueError) as cm:
+            sut.load_utf8_file_from_path('./load_environ_typed')
+
+        self.assertIn(
+            'Unexpected directory: ./load_environ_typed',
+            str(cm.exception))
+
     def test_load_pem_from_path_no_data(self) -> None:
         with self.assertRaises(ValueError) as cm:
             sut.load_pem_file_from_path('./LICENSE.txt')
@@ -153,5 +247,46 @@ class TestLoaders(unittest.TestCase):
             data_list[1].endswith('\n-----END CERTIFICATE-----\n')
         )
 
+    def test_load_pem_file_from_path_unmatched_begin(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'pem.txt'
+            path.write_text(
+                '-----BEGIN A-----\n'
+                '-----BEGIN B-----\n'
+                'MIIBAA\n'
+                '-----END B-----\n'
+                + '-----BEGIN C-----\n' * 100000,
+                encoding='ascii',
+            )
+
+            self.assertEqual(
+                [
+                    '-----BEGIN A-----\n'
+                    '-----BEGIN B-----\n'
+                    'MIIBAA\n'
+                    '-----END B-----\n'
+                ],
+                sut.load_pem_file_from_path(str(path)),
+            )
+
+    def test_load_pem_file_from_path_crlf(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'pem.txt'
+            path.write_bytes(
+                b'garbage\r\n'
+                b'-----BEGIN CERTIFICATE-----\r\n'
+                b'MIIBAA\r\n'
+                b'-----END CERTIFICATE-----'
+            )
+
+            self.assertEqual(
+                [
+                    '-----BEGIN CERTIFICATE-----\n'
+                    'MIIBAA\n'
+                    '-----END CERTIFICATE-----\n'
+                ],
+                sut.load_pem_file_from_path(str(path)),
+            )
+
     def test_load_pem_data_from_path_ok(self) -> None:
         assert 'dlHJS\n7cI7' in sut.load_pem_data_from_path('./tests/pem1.txt')